@@ -6,47 +6,177 @@ Phase P2.3.1 - CI Pipeline Integration
 Compares benchmark results against baseline to detect performance regressions.
 """
 
+import hashlib
 import json
+import mmap
+import os
+import stat
 import sys
 import argparse
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, BinaryIO, Deque, Dict, List, Tuple, Optional, TextIO, Union
 import statistics
 
+try:
+    import orjson  # Optional: SIMD-accelerated JSON parser
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # Optional: streaming parser for very large result files
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+# Benchmark name affixes stripped for report display
+_CORE_PREFIX = 'BM_MakeMove_'
+_MEMORY_PREFIX = 'BM_MakeMove_MemoryTracking/'
+_MEAN_SUFFIX = '_mean'
+
+# Report line templates
+_CORE_LINE_TMPL = "{name:15s}: {b_str} → {c_str} ({pct:+.1f}%) [{status}]\n"
+_SAFETY_LINES_TMPL = (
+    "Baseline overhead: {baseline:.2f}%\n"
+    "Current overhead:  {current:.2f}%\n"
+    "Change:           {change:+.2f}% [{status}]\n"
+)
+_MEMORY_LINE_TMPL = "Chain {name:3s}: {pct:+.1f}% throughput change [{status}]\n"
+
+# Regression thresholds from benchmark validation report
+CORE_WARN = 0.10        # 10% latency increase
+CORE_CRIT = 0.25        # 25% latency increase
+SAFETY_WARN = 0.05      # 5% overhead increase
+SAFETY_CRIT = 0.15      # 15% overhead increase
+THROUGHPUT_WARN = 0.15  # 15% throughput decrease
+THROUGHPUT_CRIT = 0.30  # 30% throughput decrease
+MEMORY_WARN = 0.20      # 20% memory increase
+MEMORY_CRIT = 0.50      # 50% memory increase
+
 
 class BenchmarkComparator:
     """Compare benchmark results and detect regressions."""
     
-    # Regression thresholds from benchmark validation report
-    REGRESSION_THRESHOLDS = {
-        'core_latency_warning': 0.10,      # 10% increase
-        'core_latency_critical': 0.25,     # 25% increase
-        'safety_overhead_warning': 0.05,   # 5% increase
-        'safety_overhead_critical': 0.15,  # 15% increase
-        'throughput_warning': 0.15,        # 15% decrease
-        'throughput_critical': 0.30,       # 30% decrease
-        'memory_warning': 0.20,            # 20% increase
-        'memory_critical': 0.50,           # 50% increase
+    # Fixed instance layout: no per-instance __dict__
+    __slots__ = (
+        'baseline_file', 'current_file', 'strip_noise', '_identical',
+        'baseline_data', 'current_data', '_baseline_index', '_current_index',
+        'warnings', 'critical_issues', '_results',
+    )
+    
+    # Read-only view of the thresholds, kept for external introspection
+    REGRESSION_THRESHOLDS = MappingProxyType({
+        'core_latency_warning': CORE_WARN,
+        'core_latency_critical': CORE_CRIT,
+        'safety_overhead_warning': SAFETY_WARN,
+        'safety_overhead_critical': SAFETY_CRIT,
+        'throughput_warning': THROUGHPUT_WARN,
+        'throughput_critical': THROUGHPUT_CRIT,
+        'memory_warning': MEMORY_WARN,
+        'memory_critical': MEMORY_CRIT,
+    })
+    
+    # (warning, critical) thresholds per category
+    _THRESHOLDS_BY_CATEGORY: Dict[str, Tuple[float, float]] = {
+        'core_latency': (CORE_WARN, CORE_CRIT),
+        'safety_overhead': (SAFETY_WARN, SAFETY_CRIT),
+        'throughput': (THROUGHPUT_WARN, THROUGHPUT_CRIT),
+        'memory': (MEMORY_WARN, MEMORY_CRIT),
     }
     
-    def __init__(self, baseline_file: str, current_file: str):
-        """Initialize comparator with baseline and current results."""
+    # Result files above this size are streamed with ijson when it is installed
+    STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+    
+    # Same-sized inputs up to this size are hashed to detect identical results
+    IDENTICAL_HASH_LIMIT_BYTES = 1024 * 1024
+    
+    # Numeric fields the comparisons read; normalized to floats in the index
+    METRIC_FIELDS = ('cpu_time', 'bytes_per_second')
+    
+    # Benchmark fields used by the comparisons; streaming keeps only these.
+    # Spelled out: mypyc-compiled class bodies cannot refer to METRIC_FIELDS
+    BENCHMARK_FIELDS = ('name', 'cpu_time', 'bytes_per_second')
+    
+    # Result keys for the baseline/current values of each row category
+    _RESULT_KEYS: Dict[str, Tuple[str, str]] = {
+        'core_latency': ('baseline_time', 'current_time'),
+        'throughput': ('baseline_throughput', 'current_throughput'),
+    }
+    
+    # Per-benchmark comparisons: (name, metric field, threshold category, direction)
+    COMPARISONS = (
+        ('BM_MakeMove_ShortChain_mean', 'cpu_time', 'core_latency', 'higher_worse'),
+        ('BM_MakeMove_MediumChain_mean', 'cpu_time', 'core_latency', 'higher_worse'),
+        ('BM_MakeMove_LongChain_mean', 'cpu_time', 'core_latency', 'higher_worse'),
+        ('BM_MakeMove_MemoryTracking/64_mean', 'bytes_per_second', 'throughput', 'lower_worse'),
+        ('BM_MakeMove_MemoryTracking/256_mean', 'bytes_per_second', 'throughput', 'lower_worse'),
+    )
+    
+    def __init__(self, baseline_file: str, current_file: str, strip_noise: bool = False):
+        """Initialize comparator with baseline and current results.
+        
+        With strip_noise, only the *_mean aggregates are kept after loading;
+        every comparison reads those, so the report is unaffected.
+        """
         self.baseline_file = baseline_file
         self.current_file = current_file
-        self.baseline_data = self._load_json(baseline_file)
-        self.current_data = self._load_json(current_file)
-        self.warnings = []
-        self.critical_issues = []
+        self.strip_noise = strip_noise
+        self._identical = self._files_identical(baseline_file, current_file)
+        if self._identical:
+            # Nothing to compare; parse once so the input is still validated
+            self.baseline_data = self.current_data = self._load_json(baseline_file)
+        else:
+            # Both loads are independent; overlap one file's I/O with the other's parse
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                baseline_future = executor.submit(self._load_json, baseline_file)
+                current_future = executor.submit(self._load_json, current_file)
+                self.baseline_data = baseline_future.result()
+                self.current_data = current_future.result()
+        self._baseline_index = self._build_index(self.baseline_data['benchmarks'])
+        self._current_index = self._build_index(self.current_data['benchmarks'])
+        self.warnings: Deque[str] = deque()
+        self.critical_issues: Deque[str] = deque()
+        self._results: Optional[Dict[str, Dict]] = None
+        
+    def _files_identical(self, first: str, second: str) -> bool:
+        """Check whether two result files are identical without parsing them."""
+        try:
+            first_stat = os.stat(first)
+            second_stat = os.stat(second)
+        except OSError:
+            # Let _load_json report the missing file
+            return False
         
+        if os.path.samestat(first_stat, second_stat):
+            return True
+        if not (stat.S_ISREG(first_stat.st_mode) and stat.S_ISREG(second_stat.st_mode)):
+            # Hashing a pipe would consume the data _load_json needs
+            return False
+        if (first_stat.st_size != second_stat.st_size
+                or first_stat.st_size > self.IDENTICAL_HASH_LIMIT_BYTES):
+            return False
+        return self._file_digest(first) == self._file_digest(second)
+    
+    def _file_digest(self, filename: str) -> bytes:
+        """Compute a short BLAKE2b digest of a file's contents."""
+        with open(filename, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+    
     def _load_json(self, filename: str) -> Dict:
         """Load JSON benchmark results."""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                if 'benchmarks' in data:
-                    return data
-                else:
-                    # Handle older format
-                    return {'benchmarks': data}
+            if ijson and os.path.getsize(filename) > self.STREAMING_THRESHOLD_BYTES:
+                benchmarks = self._stream_benchmarks(filename)
+                if benchmarks is not None:
+                    return {'benchmarks': benchmarks}
+            with open(filename, 'rb') as f:
+                data = self._parse_file(f)
+            if 'benchmarks' in data:
+                data['benchmarks'] = self._filter_benchmarks(data['benchmarks'])
+                return data
+            else:
+                # Handle older format
+                return {'benchmarks': self._filter_benchmarks(data)}
         except FileNotFoundError:
             print(f"Error: File {filename} not found")
             sys.exit(1)
@@ -54,12 +184,101 @@ class BenchmarkComparator:
             print(f"Error: Invalid JSON in {filename}")
             sys.exit(1)
     
-    def _get_benchmark_by_name(self, benchmarks: List[Dict], name: str) -> Optional[Dict]:
-        """Find benchmark by name in results."""
+    def _stream_benchmarks(self, filename: str) -> Optional[List[Dict]]:
+        """Stream benchmark entries, keeping only the fields we compare.
+        
+        Returns None if the file cannot be streamed so the caller can fall
+        back to a full parse. ijson has no NaN support, and Google Benchmark
+        writes NaN for undefined aggregates (e.g. the _cv of repeated runs),
+        so only NaN-free files are streamed; the check is a byte scan made
+        before any parsing.
+        """
+        with open(filename, 'rb') as f:
+            if self._contains_non_finite(f):
+                return None
+            f.seek(0)
+            # Older format is a bare list of benchmarks
+            prefix = 'item' if f.read(64).lstrip().startswith(b'[') else 'benchmarks.item'
+            f.seek(0)
+            try:
+                return [
+                    {key: bench[key] for key in self.BENCHMARK_FIELDS if key in bench}
+                    for bench in ijson.items(f, prefix, use_float=True)
+                    if self._keep_benchmark(bench)
+                ]
+            except ijson.JSONError:
+                return None
+    
+    def _contains_non_finite(self, f: BinaryIO) -> bool:
+        """Scan a binary file in chunks for NaN or Infinity literals."""
+        tail = b''
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if b'NaN' in window or b'Infinity' in window:
+                return True
+            # Keep enough bytes to catch a literal split across chunks
+            tail = window[-7:]
+    
+    def _keep_benchmark(self, bench: Dict) -> bool:
+        """Check whether a benchmark entry survives noise stripping."""
+        return not self.strip_noise or str(bench.get('name', '')).endswith(_MEAN_SUFFIX)
+    
+    def _filter_benchmarks(self, benchmarks: List[Dict]) -> List[Dict]:
+        """Drop median/stddev/cv and per-repetition entries when stripping noise."""
+        if not self.strip_noise:
+            return benchmarks
+        return [bench for bench in benchmarks if self._keep_benchmark(bench)]
+    
+    def _parse_file(self, f: BinaryIO) -> Any:
+        """Parse an open binary file, letting orjson read it through an mmap.
+        
+        The result is a dict, or a bare list of benchmarks in the older format.
+        """
+        st = os.fstat(f.fileno())
+        if orjson and stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'NaN') == -1 and mm.find(b'Infinity') == -1:
+                    # Parse straight from the page cache, skipping text decoding
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+        # Everything else is read with no mapping left open (pipes, FIFOs
+        # and empty files cannot be mapped) and decoded up front, so the
+        # bytes are freed before the parse tree is built
+        return self._parse_json(f.read().decode('utf-8'))
+    
+    def _parse_json(self, text: str) -> Any:
+        """Parse JSON text, preferring orjson for large result files."""
+        # Google Benchmark writes NaN for undefined aggregates (e.g. the _cv
+        # of repeated runs), which orjson rejects; send those files straight
+        # to the stdlib parser rather than failing a partial orjson parse
+        if orjson and 'NaN' not in text and 'Infinity' not in text:
+            return orjson.loads(text)
+        return json.loads(text)
+    
+    def _build_index(self, benchmarks: List[Dict]) -> Dict[str, Dict[str, float]]:
+        """Index benchmark metrics by name, keeping the first entry for each name.
+        
+        Metric fields are validated here so comparisons can subscript them
+        directly. Missing or non-numeric values are indexed as 0; the parsed
+        entries themselves are left untouched.
+        """
+        index: Dict[str, Dict[str, float]] = {}
         for bench in benchmarks:
-            if bench.get('name') == name:
-                return bench
-        return None
+            name = bench.get('name')
+            if name is None or name in index:
+                continue
+            metrics: Dict[str, float] = {}
+            for field in self.METRIC_FIELDS:
+                value = bench.get(field)
+                # bool subclasses int but is never a valid metric
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    value = 0.0
+                metrics[field] = value
+            index[name] = metrics
+        return index
     
     def _calculate_percentage_change(self, baseline: float, current: float) -> float:
         """Calculate percentage change from baseline to current."""
@@ -71,144 +290,125 @@ class BenchmarkComparator:
         """Format time with appropriate units."""
         if time_us < 1:
             return f"{time_us * 1000:.2f} ns"
-        elif time_us < 1000:
+        if time_us < 1000:
             return f"{time_us:.2f} μs"
-        else:
-            return f"{time_us / 1000:.2f} ms"
+        return f"{time_us / 1000:.2f} ms"
     
-    def compare_core_performance(self) -> Dict:
-        """Compare core makeMove performance benchmarks."""
-        core_benchmarks = [
-            'BM_MakeMove_ShortChain_mean',
-            'BM_MakeMove_MediumChain_mean',
-            'BM_MakeMove_LongChain_mean'
-        ]
+    def _run_comparisons(self) -> Dict[str, Dict]:
+        """Run every benchmark comparison once.
+        
+        Results are cached, so warnings and critical issues are only
+        recorded once however many times the compare_* accessors are called.
+        Categories run in report order so the summary lists issues in the
+        same order as the report sections.
+        """
+        if self._results is not None:
+            return self._results
         
-        results = {}
+        self._results = {
+            'core_latency': self._compare_rows('core_latency'),
+            'safety_overhead': self._compare_safety_overhead(),
+            'throughput': self._compare_rows('throughput'),
+        }
+        return self._results
+    
+    def _compare_rows(self, category: str) -> Dict[str, Dict]:
+        """Compare the COMPARISONS rows of one threshold category."""
+        baseline_key, current_key = self._RESULT_KEYS[category]
+        baseline_index = self._baseline_index
+        current_index = self._current_index
+        results: Dict[str, Dict] = {}
         
-        for bench_name in core_benchmarks:
-            baseline = self._get_benchmark_by_name(self.baseline_data['benchmarks'], bench_name)
-            current = self._get_benchmark_by_name(self.current_data['benchmarks'], bench_name)
+        for bench_name, metric, row_category, direction in self.COMPARISONS:
+            if row_category != category:
+                continue
+            if bench_name not in baseline_index or bench_name not in current_index:
+                continue
+            
+            baseline_value = baseline_index[bench_name][metric]
+            current_value = current_index[bench_name][metric]
+            change = self._calculate_percentage_change(baseline_value, current_value)
+            result: Dict[str, Union[float, str]] = {
+                baseline_key: baseline_value,
+                current_key: current_value,
+                'change_percent': change * 100,
+            }
+            
+            if direction == 'higher_worse':
+                # Format once; reused by both the issue message and the report
+                result['baseline_str'] = baseline_str = self._format_time(baseline_value)
+                result['current_str'] = current_str = self._format_time(current_value)
+                status = self._assess_performance_change(change, category)
+                message = (f"{bench_name} increased by {change*100:.1f}% "
+                           f"({baseline_str} → {current_str})")
+            else:
+                # For throughput, negative change is bad (decrease in performance)
+                status = self._assess_throughput_change(change)
+                message = f"{bench_name} throughput decreased by {abs(change)*100:.1f}%"
             
-            if baseline and current:
-                baseline_time = baseline.get('cpu_time', 0)
-                current_time = current.get('cpu_time', 0)
-                change = self._calculate_percentage_change(baseline_time, current_time)
-                
-                results[bench_name] = {
-                    'baseline_time': baseline_time,
-                    'current_time': current_time,
-                    'change_percent': change * 100,
-                    'status': self._assess_performance_change(change, 'core_latency')
-                }
-                
-                # Check thresholds
-                if change > self.REGRESSION_THRESHOLDS['core_latency_critical']:
-                    self.critical_issues.append(
-                        f"CRITICAL: {bench_name} increased by {change*100:.1f}% "
-                        f"({self._format_time(baseline_time)} → {self._format_time(current_time)})"
-                    )
-                elif change > self.REGRESSION_THRESHOLDS['core_latency_warning']:
-                    self.warnings.append(
-                        f"WARNING: {bench_name} increased by {change*100:.1f}% "
-                        f"({self._format_time(baseline_time)} → {self._format_time(current_time)})"
-                    )
+            result['status'] = status
+            results[bench_name] = result
+            self._record_issue(status, message)
         
         return results
     
+    def _record_issue(self, status: str, message: str) -> None:
+        """Record a warning or critical issue for a comparison status."""
+        if status == 'CRITICAL':
+            self.critical_issues.append(f"CRITICAL: {message}")
+        elif status == 'WARNING':
+            self.warnings.append(f"WARNING: {message}")
+    
+    def compare_core_performance(self) -> Dict:
+        """Compare core makeMove performance benchmarks."""
+        return self._run_comparisons()['core_latency']
+    
     def compare_safety_overhead(self) -> Dict:
         """Compare safety system overhead."""
-        validate_only = self._get_benchmark_by_name(
-            self.baseline_data['benchmarks'], 'BM_SafetyLevel_Comparison/0_mean'
-        )
-        light_undo_baseline = self._get_benchmark_by_name(
-            self.baseline_data['benchmarks'], 'BM_SafetyLevel_Comparison/1_mean'
-        )
-        
-        validate_only_current = self._get_benchmark_by_name(
-            self.current_data['benchmarks'], 'BM_SafetyLevel_Comparison/0_mean'
-        )
-        light_undo_current = self._get_benchmark_by_name(
-            self.current_data['benchmarks'], 'BM_SafetyLevel_Comparison/1_mean'
-        )
+        return self._run_comparisons()['safety_overhead']
+    
+    def compare_memory_performance(self) -> Dict:
+        """Compare memory-related benchmarks."""
+        return self._run_comparisons()['throughput']
+    
+    def _compare_safety_overhead(self) -> Dict:
+        """Compare light-undo overhead relative to validate-only."""
+        validate_only = 'BM_SafetyLevel_Comparison/0_mean'
+        light_undo = 'BM_SafetyLevel_Comparison/1_mean'
+        baseline_index = self._baseline_index
+        current_index = self._current_index
         
-        if all([validate_only, light_undo_baseline, validate_only_current, light_undo_current]):
+        if all(name in baseline_index and name in current_index
+               for name in (validate_only, light_undo)):
             # Calculate overhead for baseline and current
             baseline_overhead = self._calculate_percentage_change(
-                validate_only['cpu_time'], light_undo_baseline['cpu_time']
+                baseline_index[validate_only]['cpu_time'], baseline_index[light_undo]['cpu_time']
             )
             current_overhead = self._calculate_percentage_change(
-                validate_only_current['cpu_time'], light_undo_current['cpu_time']
+                current_index[validate_only]['cpu_time'], current_index[light_undo]['cpu_time']
             )
             
             overhead_change = current_overhead - baseline_overhead
+            status = self._assess_performance_change(overhead_change, 'safety_overhead')
             
-            result = {
+            self._record_issue(
+                status,
+                f"Safety overhead increased by {overhead_change*100:.1f}% "
+                f"({baseline_overhead*100:.1f}% → {current_overhead*100:.1f}%)"
+            )
+            
+            return {
                 'baseline_overhead_percent': baseline_overhead * 100,
                 'current_overhead_percent': current_overhead * 100,
                 'overhead_change_percent': overhead_change * 100,
-                'status': self._assess_performance_change(overhead_change, 'safety_overhead')
+                'status': status
             }
-            
-            # Check thresholds
-            if overhead_change > self.REGRESSION_THRESHOLDS['safety_overhead_critical']:
-                self.critical_issues.append(
-                    f"CRITICAL: Safety overhead increased by {overhead_change*100:.1f}% "
-                    f"({baseline_overhead*100:.1f}% → {current_overhead*100:.1f}%)"
-                )
-            elif overhead_change > self.REGRESSION_THRESHOLDS['safety_overhead_warning']:
-                self.warnings.append(
-                    f"WARNING: Safety overhead increased by {overhead_change*100:.1f}% "
-                    f"({baseline_overhead*100:.1f}% → {current_overhead*100:.1f}%)"
-                )
-            
-            return result
         
         return {}
     
-    def compare_memory_performance(self) -> Dict:
-        """Compare memory-related benchmarks."""
-        memory_benchmarks = [
-            'BM_MakeMove_MemoryTracking/64_mean',
-            'BM_MakeMove_MemoryTracking/256_mean'
-        ]
-        
-        results = {}
-        
-        for bench_name in memory_benchmarks:
-            baseline = self._get_benchmark_by_name(self.baseline_data['benchmarks'], bench_name)
-            current = self._get_benchmark_by_name(self.current_data['benchmarks'], bench_name)
-            
-            if baseline and current:
-                baseline_throughput = baseline.get('bytes_per_second', 0)
-                current_throughput = current.get('bytes_per_second', 0)
-                
-                # For throughput, negative change is bad (decrease in performance)
-                change = self._calculate_percentage_change(baseline_throughput, current_throughput)
-                
-                results[bench_name] = {
-                    'baseline_throughput': baseline_throughput,
-                    'current_throughput': current_throughput,
-                    'change_percent': change * 100,
-                    'status': self._assess_throughput_change(change)
-                }
-                
-                # Check thresholds (negative change is bad for throughput)
-                if change < -self.REGRESSION_THRESHOLDS['throughput_critical']:
-                    self.critical_issues.append(
-                        f"CRITICAL: {bench_name} throughput decreased by {abs(change)*100:.1f}%"
-                    )
-                elif change < -self.REGRESSION_THRESHOLDS['throughput_warning']:
-                    self.warnings.append(
-                        f"WARNING: {bench_name} throughput decreased by {abs(change)*100:.1f}%"
-                    )
-        
-        return results
-    
     def _assess_performance_change(self, change: float, category: str) -> str:
         """Assess performance change severity."""
-        warning_threshold = self.REGRESSION_THRESHOLDS[f'{category}_warning']
-        critical_threshold = self.REGRESSION_THRESHOLDS[f'{category}_critical']
+        warning_threshold, critical_threshold = self._THRESHOLDS_BY_CATEGORY[category]
         
         if change > critical_threshold:
             return 'CRITICAL'
@@ -221,79 +421,97 @@ class BenchmarkComparator:
     
     def _assess_throughput_change(self, change: float) -> str:
         """Assess throughput change (negative is bad)."""
-        if change < -self.REGRESSION_THRESHOLDS['throughput_critical']:
+        if change < -THROUGHPUT_CRIT:
             return 'CRITICAL'
-        elif change < -self.REGRESSION_THRESHOLDS['throughput_warning']:
+        elif change < -THROUGHPUT_WARN:
             return 'WARNING'
         elif change > 0.05:  # 5% improvement
             return 'IMPROVEMENT'
         else:
             return 'OK'
     
-    def generate_report(self) -> str:
-        """Generate comprehensive comparison report."""
-        report = []
-        report.append("=" * 60)
-        report.append("BENCHMARK REGRESSION ANALYSIS REPORT")
-        report.append("=" * 60)
-        report.append(f"Baseline: {self.baseline_file}")
-        report.append(f"Current:  {self.current_file}")
-        report.append("")
+    def generate_report(self, out: Optional[TextIO] = None) -> None:
+        """Write comprehensive comparison report to out (stdout by default).
+        
+        Sections are written as they are produced rather than buffered, so
+        nothing beyond the current line is held in memory.
+        """
+        if out is None:
+            out = sys.stdout
+        write = out.write
+        write("=" * 60 + "\n")
+        write("BENCHMARK REGRESSION ANALYSIS REPORT\n")
+        write("=" * 60 + "\n")
+        write(f"Baseline: {self.baseline_file}\n")
+        write(f"Current:  {self.current_file}\n")
+        write("\n")
+        
+        if self._identical:
+            write("SUMMARY\n")
+            write("-" * 40 + "\n")
+            write("✅ No performance regressions detected "
+                  "(current results are identical to baseline)\n")
+            write("\n")
+            write("=" * 60 + "\n")
+            return
         
         # Core performance analysis
-        report.append("CORE PERFORMANCE ANALYSIS")
-        report.append("-" * 40)
-        core_results = self.compare_core_performance()
+        write("CORE PERFORMANCE ANALYSIS\n")
+        write("-" * 40 + "\n")
+        results = self._run_comparisons()
+        core_results = results['core_latency']
         for bench_name, data in core_results.items():
-            clean_name = bench_name.replace('BM_MakeMove_', '').replace('_mean', '')
-            report.append(f"{clean_name:15s}: {self._format_time(data['baseline_time'])} → "
-                         f"{self._format_time(data['current_time'])} "
-                         f"({data['change_percent']:+.1f}%) [{data['status']}]")
-        report.append("")
+            write(_CORE_LINE_TMPL.format(
+                name=bench_name.removeprefix(_CORE_PREFIX).removesuffix(_MEAN_SUFFIX),
+                b_str=data['baseline_str'], c_str=data['current_str'],
+                pct=data['change_percent'], status=data['status']
+            ))
+        write("\n")
         
         # Safety overhead analysis
-        report.append("SAFETY SYSTEM OVERHEAD ANALYSIS")
-        report.append("-" * 40)
-        safety_results = self.compare_safety_overhead()
+        write("SAFETY SYSTEM OVERHEAD ANALYSIS\n")
+        write("-" * 40 + "\n")
+        safety_results = results['safety_overhead']
         if safety_results:
-            report.append(f"Baseline overhead: {safety_results['baseline_overhead_percent']:.2f}%")
-            report.append(f"Current overhead:  {safety_results['current_overhead_percent']:.2f}%")
-            report.append(f"Change:           {safety_results['overhead_change_percent']:+.2f}% "
-                         f"[{safety_results['status']}]")
+            write(_SAFETY_LINES_TMPL.format(
+                baseline=safety_results['baseline_overhead_percent'],
+                current=safety_results['current_overhead_percent'],
+                change=safety_results['overhead_change_percent'],
+                status=safety_results['status']
+            ))
         else:
-            report.append("Safety overhead data not available")
-        report.append("")
+            write("Safety overhead data not available\n")
+        write("\n")
         
         # Memory performance analysis
-        report.append("MEMORY PERFORMANCE ANALYSIS")
-        report.append("-" * 40)
-        memory_results = self.compare_memory_performance()
+        write("MEMORY PERFORMANCE ANALYSIS\n")
+        write("-" * 40 + "\n")
+        memory_results = results['throughput']
         for bench_name, data in memory_results.items():
-            clean_name = bench_name.replace('BM_MakeMove_MemoryTracking/', '').replace('_mean', '')
-            report.append(f"Chain {clean_name:3s}: {data['change_percent']:+.1f}% throughput change "
-                         f"[{data['status']}]")
-        report.append("")
+            write(_MEMORY_LINE_TMPL.format(
+                name=bench_name.removeprefix(_MEMORY_PREFIX).removesuffix(_MEAN_SUFFIX),
+                pct=data['change_percent'], status=data['status']
+            ))
+        write("\n")
         
         # Summary
-        report.append("SUMMARY")
-        report.append("-" * 40)
+        write("SUMMARY\n")
+        write("-" * 40 + "\n")
         if self.critical_issues:
-            report.append("❌ CRITICAL ISSUES DETECTED:")
+            write("❌ CRITICAL ISSUES DETECTED:\n")
             for issue in self.critical_issues:
-                report.append(f"   {issue}")
+                write(f"   {issue}\n")
         
         if self.warnings:
-            report.append("⚠️  WARNINGS:")
+            write("⚠️  WARNINGS:\n")
             for warning in self.warnings:
-                report.append(f"   {warning}")
+                write(f"   {warning}\n")
         
         if not self.critical_issues and not self.warnings:
-            report.append("✅ No performance regressions detected")
-        
-        report.append("")
-        report.append("=" * 60)
+            write("✅ No performance regressions detected\n")
         
-        return "\n".join(report)
+        write("\n")
+        write("=" * 60 + "\n")
     
     def get_exit_code(self) -> int:
         """Get appropriate exit code for CI."""
@@ -305,7 +523,7 @@ class BenchmarkComparator:
             return 0  # All good
 
 
-def main():
+def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Compare benchmark results and detect performance regressions"
@@ -315,20 +533,21 @@ def main():
     parser.add_argument("--output", "-o", help="Output report to file")
     parser.add_argument("--exit-on-regression", action="store_true",
                        help="Exit with non-zero code if regressions detected")
+    parser.add_argument("--strip-noise", action="store_true",
+                       help="Keep only *_mean aggregates when loading results")
     
     args = parser.parse_args()
     
     # Perform comparison
-    comparator = BenchmarkComparator(args.baseline, args.current)
-    report = comparator.generate_report()
+    comparator = BenchmarkComparator(args.baseline, args.current, args.strip_noise)
     
     # Output report
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(report)
+            comparator.generate_report(f)
         print(f"Report written to {args.output}")
     else:
-        print(report)
+        comparator.generate_report()
     
     # Exit with appropriate code
     if args.exit_on_regression: